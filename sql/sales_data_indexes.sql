@@ -0,0 +1,12 @@
+--
+-- Indexes on public.sales_data for the raw-data queries
+--
+-- Date-range filter with no category ("All Categories"). This is a btree
+-- rather than BRIN: the raw-data page is ORDER BY order_date ... LIMIT, which
+-- a btree can return in order, and with both on the column the planner would
+-- rarely use the BRIN anyway
+CREATE INDEX IF NOT EXISTS sales_data_order_date
+    ON public.sales_data (order_date);
+-- Date-range filter within a single category
+CREATE INDEX IF NOT EXISTS sales_data_categories_order_date
+    ON public.sales_data (categories, order_date);
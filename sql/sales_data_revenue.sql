@@ -0,0 +1,7 @@
+--
+-- Stored revenue column on public.sales_data, so queries sum it rather than
+-- computing price * quantity per row. Run before sales_daily_agg.sql.
+--
+ALTER TABLE public.sales_data
+    ADD COLUMN IF NOT EXISTS revenue numeric
+    GENERATED ALWAYS AS (price * quantity) STORED;